@@ -220,79 +220,76 @@ class EventManager:
             dict: The processed event, or None if no event was selected
         """
         difficulty = self.get_difficulty()
-        eligible_events = []
         
         # Get current season stage and allowed stages
         current_season_stage = self.config.get('franchise_info', {}).get('season_stage', 'Pre-Season')
-        allowed_stages = self._get_allowed_stages(current_season_stage)
+        allowed_stages = set(self._get_allowed_stages(current_season_stage))
         
         # Get adult content setting
         adult_content_enabled = self.config.get('adult_content_enabled', False)
         
-        # Filter standard events based on difficulty weights and season stage
-        for event in self.events.get('events', []):
-            # Check difficulty weight
-            weight = event.get('difficulty_weights', {}).get(difficulty, 0.5)
-            
-            # Check season stage eligibility
-            event_stages = event.get('season_stages', ["any"])
-            stage_match = any(stage in allowed_stages for stage in event_stages)
-            
-            # Check adult content filter
-            is_adult = event.get('adult_content', False)
-            adult_content_allowed = adult_content_enabled or not is_adult
-            
-            # If this event matches difficulty, season stage, and adult content filter, add to eligible events
-            if random.random() < weight and stage_match and adult_content_allowed:
-                eligible_events.append(event)
+        # Filter the event pool based on difficulty weights, season stage and adult content
+        eligible_events = self._filter_eligible_events(
+            self.get_event_pool(), difficulty, allowed_stages, adult_content_enabled)
+        
+        if not eligible_events:
+            return None
+        
+        # Randomly select event from eligible events
+        event = random.choice(eligible_events)
+        
+        # Process the event to fill in placeholders
+        processed_event = self._process_event(event)
+        
+        # No longer adding to history here - will do it when user accepts
+        return processed_event
+    
+    def get_event_pool(self):
+        """Get every event that can currently be rolled, before any filtering
+        
+        Returns:
+            list: Standard events, then unrealistic events if enabled, then custom events
+        """
+        event_pool = list(self.events.get('events', []))
         
         # Add unrealistic events if enabled
         if self.config.get('unrealistic_events_enabled', False):
-            for event in self.unrealistic_events.get('unrealistic_events', []):
-                # Check difficulty weight
-                weight = event.get('difficulty_weights', {}).get(difficulty, 0.5)
-                
-                # Check season stage eligibility
-                event_stages = event.get('season_stages', ["any"])
-                stage_match = any(stage in allowed_stages for stage in event_stages)
-                
-                # Check adult content filter
-                is_adult = event.get('adult_content', False)
-                adult_content_allowed = adult_content_enabled or not is_adult
-                
-                # If this event matches difficulty, season stage, and adult content filter, add to eligible events
-                if random.random() < weight and stage_match and adult_content_allowed:
-                    eligible_events.append(event)
+            event_pool.extend(self.unrealistic_events.get('unrealistic_events', []))
         
         # Add custom events if available
-        custom_events = self.config.get('custom_events', [])
-        for event in custom_events:
+        event_pool.extend(self.config.get('custom_events', []))
+        return event_pool
+    
+    def _filter_eligible_events(self, events, difficulty, allowed_stages, adult_content_enabled):
+        """Filter events by difficulty weight, season stage and adult content setting
+        
+        Every event gets its own weight roll, in list order, whether or not it
+        passes the other filters.
+        
+        Args:
+            events: The events to filter
+            difficulty: The current difficulty level
+            allowed_stages: Set of season stage names allowed right now
+            adult_content_enabled: Whether adult content events may be picked
+            
+        Returns:
+            list: The events that passed every filter
+        """
+        eligible_events = []
+        for event in events:
             # Check difficulty weight
             weight = event.get('difficulty_weights', {}).get(difficulty, 0.5)
             
             # Check season stage eligibility
-            event_stages = event.get('season_stages', ["any"])
-            stage_match = any(stage in allowed_stages for stage in event_stages)
+            stage_match = not allowed_stages.isdisjoint(event.get('season_stages', ["any"]))
             
             # Check adult content filter
-            is_adult = event.get('adult_content', False)
-            adult_content_allowed = adult_content_enabled or not is_adult
+            adult_content_allowed = adult_content_enabled or not event.get('adult_content', False)
             
             # If this event matches difficulty, season stage, and adult content filter, add to eligible events
             if random.random() < weight and stage_match and adult_content_allowed:
                 eligible_events.append(event)
-        
-        if not eligible_events:
-            return None
-        
-        # Randomly select event from eligible events
-        event = random.choice(eligible_events)
-        
-        # Process the event to fill in placeholders
-        processed_event = self._process_event(event)
-        
-        # No longer adding to history here - will do it when user accepts
-        return processed_event
+        return eligible_events
     
     def _get_allowed_stages(self, current_stage):
         """Get allowed stages for the current season stage
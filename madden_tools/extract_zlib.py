@@ -1,159 +1,359 @@
 #!/usr/bin/env python3
 import os
+import mmap
+import logging
 import zlib
 import binascii
 import struct
 import re
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
-def extract_zlib_chunk(input_file, output_dir):
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Per-chunk progress messages go to this logger at DEBUG level, so scans that
+# decode many streams do not write a line to stdout for each one
+log = logging.getLogger(__name__)
+
+# First byte of a zlib header for deflate with a 32K window
+ZLIB_CMF = 0x78
+
+def is_valid_zlib_flg(flg):
     """
-    Attempt to extract zlib compressed data from a binary file.
+    Check whether a FLG byte forms a usable zlib header after ZLIB_CMF.
     
-    This function uses multiple strategies to identify and extract zlib compressed data.
+    Per RFC 1950 the header read as a big-endian 16-bit number must be a
+    multiple of 31 (FCHECK), and we skip streams that need a preset
+    dictionary (FDICT) since they cannot be inflated without it.
+    """
+    return (ZLIB_CMF << 8 | flg) % 31 == 0 and not flg & 0x20
+
+# Second byte of the zlib headers we look for (78 01, 78 5E, 78 9C, 78 DA)
+ZLIB_FLG_BYTES = tuple(flg for flg in range(256) if is_valid_zlib_flg(flg))
+# How much compressed input to hand the decompressor at a time
+INFLATE_FEED_SIZE = 64 * 1024
+# Sanity limit on the number of entries read from an FBCHUNKS chunk table
+MAX_TABLE_ENTRIES = 4096
+# Window bits to try for chunks listed in the table: raw deflate first, then zlib
+TABLE_WBITS = (-zlib.MAX_WBITS, zlib.MAX_WBITS)
+
+_ZLIB_HEADER_RE = re.compile(re.escape(bytes([ZLIB_CMF])) + b'[' + re.escape(bytes(ZLIB_FLG_BYTES)) + b']')
+# Player names: capital letter followed by lowercase, then space, then capital followed by lowercase
+_PLAYER_NAME_RE = re.compile(rb'[A-Z][a-z]{2,10}\s+[A-Z][a-z]{2,15}')
+
+def find_zlib_headers(data):
+    """
+    Find every offset in a buffer where a zlib header starts.
+    
+    Every candidate has a valid RFC 1950 header, so only real stream starts
+    reach the decompressor. Uses a single vectorized NumPy pass when NumPy is
+    installed and falls back to a compiled regex scan otherwise, so no Python
+    code runs per byte.
     
     Args:
-        input_file: Path to the input file
-        output_dir: Directory to save extracted chunks
+        data: Bytes-like object to scan
+        
+    Returns:
+        list: Sorted offsets of candidate zlib headers
     """
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+    if np is not None:
+        arr = np.frombuffer(data, dtype=np.uint8)
+        flg = arr[1:].astype(np.uint16)
+        cand = ((arr[:-1] == ZLIB_CMF)
+                & ((flg + (ZLIB_CMF << 8)) % 31 == 0)
+                & ((flg & 0x20) == 0))
+        return np.nonzero(cand)[0].tolist()
+    return [m.start() for m in _ZLIB_HEADER_RE.finditer(data)]
+
+def inflate_stream(data, pos, wbits=zlib.MAX_WBITS):
+    """
+    Decompress the single zlib stream that starts at a given offset.
     
-    # Read the input file
-    with open(input_file, 'rb') as f:
-        data = f.read()
+    The input is fed to one decompressobj in small pieces, so the stream is
+    inflated exactly once and decoding stops as soon as its end is reached.
     
-    print(f"Input file size: {len(data)} bytes")
+    Args:
+        data: Bytes-like object holding the compressed stream
+        pos: Offset of the first byte of the stream
+        wbits: Window bits for zlib; negative values read a raw deflate stream
+        
+    Returns:
+        tuple: (decompressed bytes, number of compressed bytes consumed)
+        
+    Raises:
+        zlib.error: If the data is not a valid, complete stream
+    """
+    decompressor = zlib.decompressobj(wbits)
+    output = []
+    feed_pos = pos
+    # Feed pieces as views into the input so no compressed bytes are copied
+    with memoryview(data) as view:
+        while not decompressor.eof:
+            if feed_pos >= len(view):
+                raise zlib.error("Error -5 while decompressing data: incomplete or truncated stream")
+            piece = view[feed_pos:feed_pos+INFLATE_FEED_SIZE]
+            feed_pos += len(piece)
+            output.append(decompressor.decompress(piece))
+    consumed = feed_pos - pos - len(decompressor.unused_data)
+    return b''.join(output), consumed
+
+def read_chunk_table(data):
+    """
+    Read the chunk directory that follows the FBCHUNKS header.
+    
+    The directory is taken to be a little-endian entry count at byte 12 followed
+    by that many (offset, size) pairs. Since this layout is not confirmed for
+    every save version, the table is only trusted when every entry points inside
+    the file past the end of the table.
+    
+    Args:
+        data: Bytes-like object holding the input file
+        
+    Returns:
+        list: (offset, size) tuples, or None if no plausible table was found
+    """
+    if len(data) < 16:
+        return None
+    
+    count = struct.unpack_from('<I', data, 12)[0]
+    table_end = 16 + count * 8
+    if count == 0 or count > MAX_TABLE_ENTRIES or table_end > len(data):
+        return None
+    
+    with memoryview(data) as view:
+        entries = list(struct.iter_unpack('<II', view[16:table_end]))
+    for offset, size in entries:
+        if offset < table_end or size == 0 or offset + size > len(data):
+            return None
+    return entries
+
+def _try_inflate(data, pos):
+    """Inflate the stream at pos, returning (pos, decompressed, consumed) or None if it is not valid."""
+    try:
+        decompressed, consumed = inflate_stream(data, pos)
+    except zlib.error:
+        return None
+    return pos, decompressed, consumed
+
+def inflate_candidates(data, candidates):
+    """
+    Try to inflate a stream at every candidate offset in parallel.
     
-    # Strategy 1: Look for zlib headers (78 9C, 78 DA, 78 5E)
-    zlib_headers = [b'x\x9c', b'x\xda', b'x^']
+    Candidates are independent and zlib releases the GIL while inflating, so a
+    thread pool spreads the work across all cores.
+    
+    Args:
+        data: Bytes-like object holding the compressed streams
+        candidates: Offsets to try, in ascending order
+        
+    Returns:
+        list: (offset, decompressed bytes, bytes consumed) for each valid stream, in offset order
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(lambda pos: _try_inflate(data, pos), candidates)
+        return [result for result in results if result is not None]
+
+def write_output_file(path, data):
+    """
+    Write a buffer to a file with a raw file descriptor.
+    
+    Skips the buffered Python file object since the data is written in one go.
+    
+    Args:
+        path: Path of the file to create or overwrite
+        data: Bytes-like object to write
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def _extract_from_buffer(data, output_dir):
+    """
+    Extract zlib compressed data from an in-memory or memory-mapped buffer.
+    
+    Args:
+        data: Bytes-like object holding the input file
+        output_dir: Directory to save extracted chunks
+        
+    Returns:
+        list: Information about each decompressed chunk
+    """
+    data_view = memoryview(data)
+    
+    print(f"Input file size: {len(data)} bytes")
     
     found_chunks = []
+    # Decompressed bytes for each output file, kept for the analysis below
+    decompressed_data = {}
     
     # Check for FBCHUNKS header
     if data[:8] == b'FBCHUNKS':
         print("File has FBCHUNKS header")
         
         # Extract header info
-        version = struct.unpack('<I', data[8:12])[0]
+        version = struct.unpack_from('<I', data, 8)[0]
         print(f"Version: {version}")
         
-        # Look for the first zlib header after the FBCHUNKS header
-        for header in zlib_headers:
-            # Starting from byte 0x50 which is after header
-            pos = data.find(header, 0x50)
-            if pos != -1:
-                print(f"Found zlib header at offset 0x{pos:x}")
-                
-                # This appears to be a special format - try to extract the entire chunk
-                # Instead of using standard zlib decompression, we'll try to recreate the
-                # structure based on what we know about Madden files
-                
-                # In this case, we'll try a few different approaches:
-                
-                # Method 1: Try to extract a large chunk from this position
+        # Method 0: Decode the chunks listed in the chunk table directly. These are
+        # often raw deflate streams that have no zlib header to scan for. The table
+        # layout is not confirmed and random bytes sometimes inflate as raw deflate,
+        # so the header scan below still runs; it skips offsets decoded here
+        table_offsets = set()
+        for offset, size in read_chunk_table(data) or []:
+            for wbits in TABLE_WBITS:
                 try:
-                    # Extract a large chunk and see if it's valid zlib data
-                    # We'll try different sizes, starting with 1MB
-                    for size in [1024*1024, 2*1024*1024, 4*1024*1024, 8*1024*1024]:
-                        if pos + size > len(data):
-                            size = len(data) - pos
+                    decompressed, consumed = inflate_stream(data_view[offset:offset+size], 0, wbits)
+                except zlib.error as e:
+                    # Keep only the message; the exception would pin the buffer via its traceback
+                    error = str(e)
+                    continue
+                # A stream that ends before the entry does is a false match, not the chunk
+                if consumed == size:
+                    break
+                error = f"stream ended after {consumed} of {size} bytes"
+            else:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"Table chunk at offset 0x{offset:x} could not be decompressed: {error}")
+                continue
+            
+            output_file = os.path.join(output_dir, f"decompressed_{offset:08x}_table.bin")
+            write_output_file(output_file, decompressed)
+            decompressed_data[output_file] = decompressed
+            table_offsets.add(offset)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Successfully decompressed table chunk at offset 0x{offset:x} "
+                          f"(Table method) to {output_file} ({consumed} -> {len(decompressed)} bytes)")
+            found_chunks.append({
+                'offset': hex(offset),
+                'method': 'table',
+                'decompressed_size': len(decompressed),
+                'output_file': output_file
+            })
+        
+        # Look for the first zlib header after the FBCHUNKS header with one scan
+        # for all header types, starting from byte 0x50 which is after header
+        match = _ZLIB_HEADER_RE.search(data, 0x50)
+        if match is not None:
+            pos = match.start()
+            print(f"Found zlib header at offset 0x{pos:x}")
+            
+            # This appears to be a special format - try to extract the entire chunk
+            # Instead of using standard zlib decompression, we'll try to recreate the
+            # structure based on what we know about Madden files
+            
+            # In this case, we'll try a few different approaches:
+            
+            # Method 1: Try to decompress a single stream from this position
+            try:
+                # Try direct zlib decompression. A single decompressobj finds the end
+                # of the stream itself, so there is no need to retry growing sizes
+                try:
+                    decompressed, consumed = inflate_stream(data_view, pos)
+                except zlib.error as e:
+                    print(f"Direct decompression failed: {e}")
+                    decompressed = None
+                
+                if decompressed is not None and pos in table_offsets:
+                    print(f"Chunk at offset 0x{pos:x} was already decompressed from the chunk table")
+                elif decompressed is not None:
+                    output_file = os.path.join(output_dir, f"decompressed_{pos:08x}.bin")
+                    write_output_file(output_file, decompressed)
+                    decompressed_data[output_file] = decompressed
+                    print(f"Successfully decompressed chunk (Direct method) to {output_file} "
+                          f"({consumed} -> {len(decompressed)} bytes)")
+                    found_chunks.append({
+                        'offset': hex(pos),
+                        'method': 'direct',
+                        'decompressed_size': len(decompressed),
+                        'output_file': output_file
+                    })
+                else:
+                    # The scans only run when the direct method found nothing. They look
+                    # at up to 8MB from this position; slicing the memoryview shares the
+                    # file buffer instead of copying it
+                    size = min(8*1024*1024, len(data) - pos)
+                    chunk_data = data_view[pos:pos+size]
+                    
+                    # Method 2: Try to scan through the chunk to find valid zlib streams
+                    # Only offsets that start with a zlib header are worth trying
+                    candidates = find_zlib_headers(chunk_data)
+                    resume_pos = 0
+                    # Every candidate is decoded up front, then streams that start inside
+                    # an earlier stream are skipped. The decompressor finds the end of
+                    # each stream on its own
+                    inflated = inflate_candidates(chunk_data, candidates)
+                    for sub_pos, decompressed, consumed in inflated:
+                        if sub_pos < resume_pos:
+                            continue
+                        if pos + sub_pos in table_offsets:
+                            resume_pos = sub_pos + consumed
+                            continue
                         
-                        chunk_data = data[pos:pos+size]
+                        # Success! Save the decompressed data
+                        output_file = os.path.join(output_dir, f"decompressed_{pos:08x}_{sub_pos:08x}.bin")
+                        write_output_file(output_file, decompressed)
+                        decompressed_data[output_file] = decompressed
                         
-                        # First, write the raw chunk to examine
-                        raw_output = os.path.join(output_dir, f"raw_chunk_{pos:08x}.bin")
-                        with open(raw_output, 'wb') as f:
-                            f.write(chunk_data)
-                        print(f"Saved raw chunk to {raw_output} ({len(chunk_data)} bytes)")
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug(f"Successfully decompressed sub-chunk at offset 0x{pos+sub_pos:x} "
+                                      f"(Sub-scan method) to {output_file} ({len(decompressed)} bytes)")
                         
-                        # Try direct zlib decompression
-                        try:
-                            decompressed = zlib.decompress(chunk_data)
-                            output_file = os.path.join(output_dir, f"decompressed_{pos:08x}.bin")
-                            with open(output_file, 'wb') as f:
-                                f.write(decompressed)
-                            print(f"Successfully decompressed chunk (Direct method) to {output_file} ({len(decompressed)} bytes)")
-                            found_chunks.append({
-                                'offset': hex(pos),
-                                'method': 'direct',
-                                'decompressed_size': len(decompressed),
-                                'output_file': output_file
-                            })
-                            break
-                        except zlib.error as e:
-                            print(f"Direct decompression failed: {e}")
+                        found_chunks.append({
+                            'offset': hex(pos+sub_pos),
+                            'method': 'sub-scan',
+                            'decompressed_size': len(decompressed),
+                            'output_file': output_file
+                        })
                         
-                        # Method 2: Try to scan through the chunk to find valid zlib streams
-                        # This method looks for potential zlib headers within the chunk
-                        sub_pos = 0
-                        while sub_pos < len(chunk_data) - 2:
-                            for sub_header in zlib_headers:
-                                if chunk_data[sub_pos:sub_pos+2] == sub_header:
-                                    # Found potential zlib header, try to decompress
-                                    for sub_size in [1000, 5000, 10000, 50000, 100000]:
-                                        if sub_pos + sub_size > len(chunk_data):
-                                            sub_size = len(chunk_data) - sub_pos
-                                        
-                                        try:
-                                            sub_chunk = chunk_data[sub_pos:sub_pos+sub_size]
-                                            decompressed = zlib.decompress(sub_chunk)
-                                            
-                                            # Success! Save the decompressed data
-                                            output_file = os.path.join(output_dir, f"decompressed_{pos:08x}_{sub_pos:08x}.bin")
-                                            with open(output_file, 'wb') as f:
-                                                f.write(decompressed)
-                                            
-                                            print(f"Successfully decompressed sub-chunk at offset 0x{pos+sub_pos:x} "
-                                                  f"(Sub-scan method) to {output_file} ({len(decompressed)} bytes)")
-                                            
-                                            found_chunks.append({
-                                                'offset': hex(pos+sub_pos),
-                                                'method': 'sub-scan',
-                                                'decompressed_size': len(decompressed),
-                                                'output_file': output_file
-                                            })
-                                            
-                                            # Skip ahead past this chunk
-                                            sub_pos += sub_size
-                                            break
-                                        except zlib.error:
-                                            continue
-                            sub_pos += 1
+                        # Skip ahead past this stream
+                        resume_pos = sub_pos + consumed
+                    
+                    # Method 3: Try to use sliding window decompression
+                    # A fixed window at a header only decompresses when the whole stream
+                    # ends inside it, so the streams inflated above already tell us which
+                    # windows succeed and what they hold. Offsets whose stream failed to
+                    # inflate can never succeed here and are not tried again
+                    window_size = 1024  # 1KB window
+                    resume_pos = 0
+                    
+                    for window_pos, decompressed, consumed in inflated:
+                        if window_pos >= len(chunk_data) - window_size:
+                            break
+                        if window_pos < resume_pos or consumed > window_size:
+                            continue
+                        if pos + window_pos in table_offsets:
+                            resume_pos = window_pos + window_size
+                            continue
                         
-                        # Method 3: Try to use sliding window decompression
-                        # This method tries to decompress data using a sliding window approach
-                        window_size = 1024  # 1KB window
-                        window_pos = 0
+                        # Success! Save the decompressed data
+                        output_file = os.path.join(output_dir, f"decompressed_{pos:08x}_win_{window_pos:08x}.bin")
+                        write_output_file(output_file, decompressed)
+                        decompressed_data[output_file] = decompressed
                         
-                        while window_pos < len(chunk_data) - window_size:
-                            try:
-                                window_data = chunk_data[window_pos:window_pos+window_size]
-                                decompressed = zlib.decompress(window_data)
-                                
-                                # Success! Save the decompressed data
-                                output_file = os.path.join(output_dir, f"decompressed_{pos:08x}_win_{window_pos:08x}.bin")
-                                with open(output_file, 'wb') as f:
-                                    f.write(decompressed)
-                                
-                                print(f"Successfully decompressed window at offset 0x{pos+window_pos:x} "
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug(f"Successfully decompressed window at offset 0x{pos+window_pos:x} "
                                       f"(Window method) to {output_file} ({len(decompressed)} bytes)")
-                                
-                                found_chunks.append({
-                                    'offset': hex(pos+window_pos),
-                                    'method': 'window',
-                                    'decompressed_size': len(decompressed),
-                                    'output_file': output_file
-                                })
-                                
-                                # Skip ahead past this window
-                                window_pos += window_size
-                            except zlib.error:
-                                window_pos += 1  # Slide the window by 1 byte
-                except Exception as e:
-                    print(f"Error processing main chunk: {e}")
-                
-                break
+                        
+                        found_chunks.append({
+                            'offset': hex(pos+window_pos),
+                            'method': 'window',
+                            'decompressed_size': len(decompressed),
+                            'output_file': output_file
+                        })
+                        
+                        # Skip ahead past this window
+                        resume_pos = window_pos + window_size
+            except Exception as e:
+                print(f"Error processing main chunk: {e}")
     
     print("\nExtraction Results:")
     print(f"Found {len(found_chunks)} decompressed chunks")
@@ -167,12 +367,10 @@ def extract_zlib_chunk(input_file, output_dir):
         
         # Try to identify player data in the decompressed chunk
         try:
-            with open(chunk['output_file'], 'rb') as f:
-                chunk_data = f.read()
+            chunk_data = decompressed_data[chunk['output_file']]
             
-            # Look for player names (capital letter followed by lowercase, then space, then capital followed by lowercase)
-            name_pattern = re.compile(b'[A-Z][a-z]{2,10}\\s+[A-Z][a-z]{2,15}')
-            matches = name_pattern.finditer(chunk_data)
+            # Look for player names
+            matches = _PLAYER_NAME_RE.finditer(chunk_data)
             
             names_found = []
             for match in matches:
@@ -190,7 +388,40 @@ def extract_zlib_chunk(input_file, output_dir):
     
     return found_chunks
 
+def extract_zlib_chunk(input_file, output_dir):
+    """
+    Attempt to extract zlib compressed data from a binary file.
+    
+    This function uses multiple strategies to identify and extract zlib compressed data.
+    
+    Args:
+        input_file: Path to the input file
+        output_dir: Directory to save extracted chunks
+    """
+    # Create output directory if it doesn't exist
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Memory-map the input file so the OS pages it in on demand instead of
+    # reading the whole save into one bytes object. Empty files cannot be mapped
+    with open(input_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _extract_from_buffer(b'', output_dir)
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    try:
+        return _extract_from_buffer(data, output_dir)
+    finally:
+        try:
+            data.close()
+        except BufferError:
+            # A view of the map is still alive, e.g. held by the traceback of an
+            # error raised above; closing must not replace that error. The map
+            # is released once the last view goes away
+            pass
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     input_file = "resources/CAREER-2017BETA"
     output_dir = "madden_extracted_zlib"
     
@@ -6,7 +6,7 @@ Launcher for Madden Franchise Event Generator
 import os
 import sys
 import traceback
-import importlib.util
+import importlib
 
 # Fix for Qt dialogs on macOS
 if sys.platform == 'darwin':
@@ -17,27 +17,31 @@ project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
 try:
-    # Check if PySide6 is installed
-    if importlib.util.find_spec("PySide6") is None:
-        print("PySide6 is not installed. Installing...")
+    # Import the dependencies directly and only install them when the import
+    # fails, so a normal startup doesn't have to probe sys.path first
+    try:
+        import appdirs
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtGui import QIcon
+    except ModuleNotFoundError as e:
+        # Only a missing dependency can be fixed by installing it. Anything else, such
+        # as PySide6 failing to load its Qt libraries, is reported as is
+        if e.name is None or not (e.name == 'appdirs' or e.name == 'PySide6' or e.name.startswith('PySide6.')):
+            raise
+        print(f"{e.name} is not installed. Installing PySide6 and appdirs...")
         import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "PySide6"])
-        print("PySide6 successfully installed.")
-    
-    # Check if appdirs is installed
-    if importlib.util.find_spec("appdirs") is None:
-        print("appdirs is not installed. Installing...")
-        import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "appdirs"])
-        print("appdirs successfully installed.")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "PySide6", "appdirs"])
+        print("PySide6 and appdirs successfully installed.")
+        
+        # Make sure the freshly installed packages are visible to the import system
+        importlib.invalidate_caches()
+        import appdirs
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtGui import QIcon
     
     # Import and run the application
     from madden_franchise_qt.main import main
     
-    # Import QApplication and QIcon to set app icon
-    from PySide6.QtWidgets import QApplication
-    from PySide6.QtGui import QIcon
-    
     # Set app icon
     app = QApplication(sys.argv)
     icon_path = os.path.join(project_root, 'resources', 'logo1.png')
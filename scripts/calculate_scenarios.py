@@ -3,8 +3,22 @@ import json
 import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Event fields whose number of choices multiplies an event's scenario count.
+# trainer_impacts and target_impacts are tied to their options and add nothing
+MULTIPLIER_FIELDS = (
+    'target_options', 'reason_options', 'games_options', 'penalty_options',
+    'position_options', 'school_options', 'player_options', 'trainer_options',
+    'award_options', 'stat_options', 'round_options', 'result_options'
+)
+
 def count_scenarios_in_option(option):
     """Count scenarios in a single option, including nested options."""
     try:
@@ -30,75 +44,16 @@ def count_event_scenarios(event):
     try:
         base_count = 1
         
-        # Account for target options
-        if 'target_options' in event and event['target_options']:
-            # Special case: if 'all-players' is one of the options, this represents all players
-            # For simplicity, we'll use a standard roster size
-            if 'all-players' in event['target_options']:
-                base_count *= 53  # Standard NFL roster size
-            else:
-                base_count *= len(event['target_options'])
-        
-        # Account for reason options
-        if 'reason_options' in event and event['reason_options']:
-            base_count *= len(event['reason_options'])
-        
-        # Account for games options (suspension length, etc.)
-        if 'games_options' in event and event['games_options']:
-            base_count *= len(event['games_options'])
-        
-        # Account for penalty options
-        if 'penalty_options' in event and event['penalty_options']:
-            base_count *= len(event['penalty_options'])
-        
-        # Account for position options
-        if 'position_options' in event and event['position_options']:
-            base_count *= len(event['position_options'])
-            
-        # Account for school options
-        if 'school_options' in event and event['school_options']:
-            base_count *= len(event['school_options'])
-            
-        # Account for player options
-        if 'player_options' in event and event['player_options']:
-            base_count *= len(event['player_options'])
-        
-        # Account for trainer options and their impacts
-        if 'trainer_options' in event and event['trainer_options']:
-            # Check if these are simple strings or objects
-            if isinstance(event['trainer_options'][0], str):
-                base_count *= len(event['trainer_options'])
-            else:
-                # Complex objects
-                base_count *= len(event['trainer_options'])
-        
-        # Account for trainer impacts
-        if 'trainer_impacts' in event and event['trainer_impacts']:
-            # We don't multiply by this since it's tied to trainer_options
-            pass
-        
-        # Account for award options
-        if 'award_options' in event and event['award_options']:
-            base_count *= len(event['award_options'])
-        
-        # Account for stat options
-        if 'stat_options' in event and event['stat_options']:
-            base_count *= len(event['stat_options'])
-        
-        # Account for round options
-        if 'round_options' in event and event['round_options']:
-            base_count *= len(event['round_options'])
-        
-        # Account for result options
-        if 'result_options' in event and event['result_options']:
-            # Check if these are simple values or objects with probabilities
-            if isinstance(event['result_options'], list):
-                base_count *= len(event['result_options'])
-        
-        # Account for target impacts (specific effects based on target)
-        if 'target_impacts' in event and event['target_impacts']:
-            # We don't multiply by this since it's tied to target_options
-            pass
+        for field in MULTIPLIER_FIELDS:
+            values = event.get(field)
+            if not values:
+                continue
+            # Special case: 'all-players' represents every player, so use a standard roster size
+            if field == 'target_options' and 'all-players' in values:
+                base_count *= 53
+            # Only lists of result options (simple values or objects with probabilities) branch
+            elif field != 'result_options' or isinstance(values, list):
+                base_count *= len(values)
         
         # Account for direct options - these create branching paths
         if 'options' in event and event['options']:
@@ -113,6 +68,23 @@ def count_event_scenarios(event):
         print(f"Error counting scenarios for event {event_id} ({event_title}): {e}", file=sys.stderr)
         return 1  # Default to 1 on error
 
+@lru_cache(maxsize=None)
+def _load_json_file(path, mtime):
+    """Parse a JSON file, using orjson when it is installed.
+    
+    The modification time is only part of the cache key, so an edited file is
+    parsed again while repeated loads of an unchanged file are free.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def load_events_file(path, key):
+    """Load the list of events stored under key in an events JSON file."""
+    return _load_json_file(str(path), os.path.getmtime(path))[key]
+
 def calculate_total_scenarios():
     """Calculate the total number of unique scenarios across all events."""
     try:
@@ -122,11 +94,8 @@ def calculate_total_scenarios():
         unrealistic_events_path = base_dir / 'madden_franchise_qt' / 'data' / 'unrealistic_events.json'
         
         # Load the event files
-        with open(regular_events_path, 'r') as f:
-            regular_events = json.load(f)['events']
-            
-        with open(unrealistic_events_path, 'r') as f:
-            unrealistic_events = json.load(f)['unrealistic_events']
+        regular_events = load_events_file(regular_events_path, 'events')
+        unrealistic_events = load_events_file(unrealistic_events_path, 'unrealistic_events')
         
         # Calculate scenarios for each event
         regular_scenario_counts = [count_event_scenarios(event) for event in regular_events]
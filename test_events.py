@@ -3,167 +3,309 @@ import json
 import random
 import sys
 import os
-from unittest.mock import MagicMock, patch
+import copy
+from functools import lru_cache
+from unittest.mock import patch
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 from madden_franchise_qt.utils.event_manager import EventManager
 
+EVENTS_PATH = 'madden_franchise_qt/data/events.json'
+UNREALISTIC_EVENTS_PATH = 'madden_franchise_qt/data/unrealistic_events.json'
+
+@lru_cache(maxsize=None)
+def _read_bytes(path):
+    """Read a file once for the whole test run."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def _load_json(path):
+    """Parse a JSON file into a new object, using orjson when it is installed."""
+    raw = _read_bytes(path)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def load_events_data():
+    """Parse a fresh copy of the real event data."""
+    return _load_json(EVENTS_PATH)
+
+def load_unrealistic_events_data():
+    """Parse a fresh copy of the unrealistic events, or an empty list if they can't be read."""
+    try:
+        return _load_json(UNREALISTIC_EVENTS_PATH)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Could not load unrealistic events: {e}", file=sys.stderr)
+    return {"unrealistic_events": []}
+
+@lru_cache(maxsize=None)
+def load_events_with_options():
+    """All events that have at least one option."""
+    return [e for e in load_events_data().get('events', []) if e.get('options')]
+
+@lru_cache(maxsize=None)
+def load_events_with_random_impacts():
+    """All events with an option that picks its impact at random."""
+    return [e for e in load_events_data().get('events', [])
+            if any(isinstance(o, dict) and 'impact_random_options' in o for o in e.get('options') or [])]
+
+# The informational listing tests only run when this is set
+VERBOSE_TESTS = bool(os.environ.get('VERBOSE_TESTS'))
+
+def _parse_event_ids(value):
+    """Split a comma separated id list into (ids, tokens that are not integers)."""
+    event_ids = set()
+    bad_tokens = []
+    for token in value.split(','):
+        token = token.strip()
+        if not token:
+            continue
+        try:
+            event_ids.add(int(token))
+        except ValueError:
+            bad_tokens.append(token)
+    return frozenset(event_ids), tuple(bad_tokens)
+
+# Comma separated event ids, e.g. EVENT_IDS=5,17, to re-run only those events
+# in test_all_events_processable after a failure. Bad values fail that test
+# instead of breaking the import of the whole module
+ONLY_EVENT_IDS, INVALID_EVENT_IDS = _parse_event_ids(os.environ.get('EVENT_IDS', ''))
+
+# Events known to have options
+OPTION_EVENT_IDS = (10, 11, 12, 21, 22, 48, 50)
+# Events known to have random impact options
+RANDOM_IMPACT_EVENT_IDS = (10, 22, 38, 51)
+# Events known to have trainers
+TRAINER_EVENT_IDS = (19, 20, 35, 69, 70, 71, 72, 73, 74, 75, 76)
+# Events that might have nested options
+NESTED_EVENT_IDS = (12, 16, 68)
+
+# Required event layout, checked by test_event_schema_validation
+DIFFICULTY_LEVELS = ["cupcake", "rookie", "pro", "all-madden", "diabolical"]
+EVENT_SCHEMA = {
+    "type": "object",
+    "required": ["id", "title", "description", "difficulty_weights", "category", "season_stages"],
+    "properties": {
+        "difficulty_weights": {"type": "object", "required": DIFFICULTY_LEVELS},
+        "season_stages": {"type": "array", "minItems": 1},
+        # Each option needs a description and either a direct or a random impact
+        "options": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["description"],
+                "anyOf": [{"required": ["impact"]}, {"required": ["impact_random_options"]}]
+            }
+        }
+    }
+}
+
+# Compiled schema validator when fastjsonschema is installed, otherwise the
+# test checks each rule itself
+validate_event = fastjsonschema.compile(EVENT_SCHEMA) if fastjsonschema is not None else None
+
+# A basic config with all needed values
+_BASE_CONFIG = {
+    "difficulty": "pro",
+    "franchise_info": {
+        "team_name": "Test Team",
+        "current_week": 1,
+        "current_year": 2023,
+        "season_stage": "Pre-Season"  # Correct capitalization
+    },
+    "roster": {
+        "QB1": "Test Quarterback",
+        "QB2": "Backup Quarterback",
+        "WR1": "Test Receiver",
+        "WR2": "Test Receiver 2",
+        "WR3": "Test Receiver 3",
+        "WR4": "Test Receiver 4",
+        "RB1": "Test Runner",
+        "RB2": "Test Runner 2",
+        "RB3": "Test Runner 3",
+        "TE1": "Test End",
+        "TE2": "Test End 2",
+        "CB1": "Test Corner",
+        "CB2": "Test Corner 2",
+        "CB3": "Test Corner 3",
+        "MLB1": "Test Linebacker",
+        "MLB2": "Test Linebacker 2",
+        "LOLB1": "Test LOLB",
+        "LOLB2": "Test LOLB 2",
+        "ROLB1": "Test ROLB",
+        "ROLB2": "Test ROLB 2",
+        "FS1": "Test Safety",
+        "FS2": "Test Safety 2",
+        "SS1": "Test Strong Safety",
+        "SS2": "Test Strong Safety 2",
+        "K1": "Test Kicker",
+        "P1": "Test Punter",
+        "LT1": "Test Left Tackle",
+        "LT2": "Test Left Tackle 2",
+        "LG1": "Test Left Guard",
+        "LG2": "Test Left Guard 2",
+        "C1": "Test Center",
+        "C2": "Test Center 2",
+        "RG1": "Test Right Guard",
+        "RG2": "Test Right Guard 2",
+        "RT1": "Test Right Tackle",
+        "RT2": "Test Right Tackle 2",
+        "DT1": "Test Tackle",
+        "DT2": "Test Tackle 2",
+        "DT3": "Test Tackle 3",
+        "LE1": "Test End",
+        "LE2": "Test End 2",
+        "RE1": "Test Right End",
+        "RE2": "Test Right End 2",
+        "FB1": "Test Fullback"
+    },
+    "unrealistic_events_enabled": True,
+    # Set here so EventManager does not write its default into the shared config
+    "adult_content_enabled": False
+}
+
+class _StubDataManager:
+    """Minimal stand-in for DataManager that serves fixed data and never writes to disk."""
+    
+    def __init__(self, events_data, unrealistic_events_data, config):
+        self._events_data = events_data
+        self._unrealistic_events_data = unrealistic_events_data
+        self._config = config
+    
+    def load_config(self):
+        return self._config
+    
+    def load_events(self):
+        return self._events_data
+    
+    def load_unrealistic_events(self):
+        return self._unrealistic_events_data
+    
+    def save_config(self, config):
+        pass
+    
+    def save_franchise(self, config, filename=None):
+        return True, "Franchise saved"
+
 class TestEvents(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Basic config with all needed values, shared by tests that only read it.
+        # Tests that change the config give their event manager a private copy
+        cls.test_config = _BASE_CONFIG
+        
+        # One event manager for the whole class; setUp gives it freshly parsed
+        # events and resets its state before each test
+        cls._shared_event_manager = EventManager(
+            _StubDataManager(load_events_data(), load_unrealistic_events_data(), cls.test_config))
+    
     def setUp(self):
-        # Create a mock data manager
-        self.data_manager = MagicMock()
-        
-        # Load real event data for testing
-        with open('madden_franchise_qt/data/events.json', 'r') as f:
-            self.events_data = json.load(f)
-        
-        # Try to load unrealistic events if they exist
-        self.unrealistic_events_data = {"unrealistic_events": []}
-        unrealistic_events_path = 'madden_franchise_qt/data/unrealistic_events.json'
-        if os.path.exists(unrealistic_events_path):
-            try:
-                with open(unrealistic_events_path, 'r') as f:
-                    self.unrealistic_events_data = json.load(f)
-            except Exception as e:
-                print(f"Could not load unrealistic events: {e}", file=sys.stderr)
-        
-        # Mock the data manager to return our test data
-        self.data_manager.load_events.return_value = self.events_data
-        self.data_manager.load_unrealistic_events.return_value = self.unrealistic_events_data
-        
-        # Set up a basic config with all needed values
-        self.test_config = {
-            "difficulty": "pro",
-            "franchise_info": {
-                "team_name": "Test Team",
-                "current_week": 1,
-                "current_year": 2023,
-                "season_stage": "Pre-Season"  # Correct capitalization
-            },
-            "roster": {
-                "QB1": "Test Quarterback",
-                "QB2": "Backup Quarterback",
-                "WR1": "Test Receiver",
-                "WR2": "Test Receiver 2",
-                "WR3": "Test Receiver 3",
-                "WR4": "Test Receiver 4",
-                "RB1": "Test Runner",
-                "RB2": "Test Runner 2",
-                "RB3": "Test Runner 3",
-                "TE1": "Test End",
-                "TE2": "Test End 2",
-                "CB1": "Test Corner",
-                "CB2": "Test Corner 2",
-                "CB3": "Test Corner 3",
-                "MLB1": "Test Linebacker",
-                "MLB2": "Test Linebacker 2",
-                "LOLB1": "Test LOLB",
-                "LOLB2": "Test LOLB 2",
-                "ROLB1": "Test ROLB",
-                "ROLB2": "Test ROLB 2",
-                "FS1": "Test Safety",
-                "FS2": "Test Safety 2",
-                "SS1": "Test Strong Safety",
-                "SS2": "Test Strong Safety 2",
-                "K1": "Test Kicker",
-                "P1": "Test Punter",
-                "LT1": "Test Left Tackle",
-                "LT2": "Test Left Tackle 2",
-                "LG1": "Test Left Guard",
-                "LG2": "Test Left Guard 2",
-                "C1": "Test Center",
-                "C2": "Test Center 2",
-                "RG1": "Test Right Guard",
-                "RG2": "Test Right Guard 2",
-                "RT1": "Test Right Tackle",
-                "RT2": "Test Right Tackle 2",
-                "DT1": "Test Tackle",
-                "DT2": "Test Tackle 2",
-                "DT3": "Test Tackle 3",
-                "LE1": "Test End",
-                "LE2": "Test End 2",
-                "RE1": "Test Right End",
-                "RE2": "Test Right End 2",
-                "FB1": "Test Fullback"
-            },
-            "unrealistic_events_enabled": True
-        }
+        # Freshly parsed events, so no test sees another test's changes
+        self.events_data = load_events_data()
+        self.unrealistic_events_data = load_unrealistic_events_data()
+        self.events_by_id = {e.get('id'): e for e in self.events_data.get('events', [])}
+        self.data_manager = _StubDataManager(self.events_data, self.unrealistic_events_data, self.test_config)
+        
+        # Undo anything the previous test changed on the shared event manager
+        self.event_manager = self._shared_event_manager
+        self.event_manager.data_manager = self.data_manager
+        self.event_manager.config = self.test_config
+        self.event_manager.events = self.events_data
+        self.event_manager.unrealistic_events = self.unrealistic_events_data
+        self.event_manager.clear_event_history()
+    
+    @classmethod
+    def tearDownClass(cls):
+        del cls._shared_event_manager
+    
+    def _events_with_ids(self, event_ids):
+        """Return the events with the given ids that exist in events.json, in id order."""
+        return [self.events_by_id[event_id] for event_id in event_ids if event_id in self.events_by_id]
+    
+    def _check_event_processable(self, event):
+        """Process and accept one event as a subtest, returning True if it passed."""
+        event_id = event.get('id', 'unknown')
+        title = event.get('title', 'Unknown Event')
+        processed = False
         
-        self.data_manager.load_config.return_value = self.test_config
+        with self.subTest(event_id=event_id, title=title):
+            # Set random seed for deterministic testing
+            random.seed(event_id)
+            
+            # Process the event
+            processed_event = self.event_manager._process_event(event)
+            
+            # Basic assertions
+            self.assertIsNotNone(processed_event)
+            self.assertIn('processed_description', processed_event)
+            
+            # If it has target_options, verify target replacement
+            if 'target_options' in event and '{target}' in event.get('description', ''):
+                self.assertIn('selected_target', processed_event)
+                self.assertNotIn('{target}', processed_event['processed_description'])
+            
+            # If it has options, verify they were processed
+            if 'options' in event:
+                for option in processed_event['options']:
+                    self.assertIn('processed_description', option)
+            
+            # If it has result_options, make sure they were correctly processed
+            if 'result_options' in event:
+                self.assertIn('selected_result', processed_event)
+            
+            # Try accepting the event
+            self.event_manager.accept_event(processed_event)
+            processed = True
         
-        # Create the event manager with our mock data manager
-        self.event_manager = EventManager(self.data_manager)
+        return processed
     
     def test_all_events_processable(self):
         """Test that all events can be processed without errors."""
+        if INVALID_EVENT_IDS:
+            self.fail(f"EVENT_IDS must be comma separated integers, got: {', '.join(INVALID_EVENT_IDS)}")
+        
         events = self.events_data.get('events', [])
+        if ONLY_EVENT_IDS:
+            events = [e for e in events if e.get('id') in ONLY_EVENT_IDS]
         total_events = len(events)
-        processed_count = 0
-        failed_events = []
         
-        for event in events:
-            event_id = event.get('id', 'unknown')
-            title = event.get('title', 'Unknown Event')
-            
-            # Set random seed for deterministic testing
-            random.seed(event_id)
-            
-            try:
-                # Process the event
-                processed_event = self.event_manager._process_event(event)
-                
-                # Basic assertions
-                self.assertIsNotNone(processed_event)
-                self.assertIn('processed_description', processed_event)
-                
-                # If it has target_options, verify target replacement
-                if 'target_options' in event and '{target}' in event.get('description', ''):
-                    self.assertIn('selected_target', processed_event)
-                    self.assertNotIn('{target}', processed_event['processed_description'])
-                
-                # If it has options, verify they were processed
-                if 'options' in event:
-                    for option in processed_event['options']:
-                        self.assertIn('processed_description', option)
-                
-                # If it has result_options, make sure they were correctly processed
-                if 'result_options' in event:
-                    # Hard-code the random selection for testing
-                    with patch('random.random', return_value=0.3):
-                        # Re-process with mocked random
-                        processed_event = self.event_manager._process_event(event)
-                        self.assertIn('selected_result', processed_event)
-                        
-                # Try accepting the event
-                self.event_manager.accept_event(processed_event)
-                
-                processed_count += 1
-                print(f"Successfully processed event {event_id}: {title}")
-            except Exception as e:
-                failed_events.append((event_id, title, str(e)))
-                print(f"Failed to process event {event_id}: {title} - {str(e)}", file=sys.stderr)
-        
-        if failed_events:
-            for event_id, title, error in failed_events:
-                print(f"Event {event_id} ({title}) failed: {error}", file=sys.stderr)
-            
-            self.fail(f"Failed to process {len(failed_events)} out of {total_events} events.")
+        # Events with result_options get their result roll hard-coded. Only the
+        # result roll uses random.random, so those events are processed together
+        # under a single patch after the rest
+        result_events = [e for e in events if 'result_options' in e]
+        other_events = [e for e in events if 'result_options' not in e]
+        
+        # Each event runs as its own subtest, so one failing event is reported
+        # without stopping the rest
+        processed_count = sum(self._check_event_processable(event) for event in other_events)
+        with patch('random.random', return_value=0.3):
+            processed_count += sum(self._check_event_processable(event) for event in result_events)
         
-        print(f"Successfully processed all {processed_count} events.")
+        print(f"Successfully processed {processed_count} out of {total_events} events.")
     
     def test_events_with_options(self):
         """Test events with options are processed correctly."""
         # Choose specific event IDs that have options
-        option_event_ids = [10, 11, 12, 21, 22, 48, 50]  # Events known to have options
-        
-        events_with_options = [e for e in self.events_data.get('events', []) 
-                              if e.get('id') in option_event_ids]
+        events_with_options = self._events_with_ids(OPTION_EVENT_IDS)
         
         if not events_with_options:
             self.skipTest("No events with options found")
         
         for event in events_with_options:
-            try:
+            with self.subTest(event_id=event.get('id'), title=event.get('title')):
                 # Process the event
+                random.seed(event['id'])
                 processed_event = self.event_manager._process_event(event)
                 
                 # Verify options
@@ -181,24 +323,18 @@ class TestEvents(unittest.TestCase):
                     
                     # Clear history for next test
                     self.event_manager.clear_event_history()
-                    
-                print(f"Successfully tested event with options: {event.get('id')} - {event.get('title')}")
-            except Exception as e:
-                self.fail(f"Event with options {event.get('id')} - {event.get('title')} failed: {str(e)}")
     
     def test_random_impact_options(self):
         """Test events with random impact options."""
         # Choose specific event IDs with random impact options
-        random_impact_ids = [10, 22, 38, 51]  # Events known to have random impact options
-        
-        events_with_random_impacts = [e for e in self.events_data.get('events', []) 
-                                     if e.get('id') in random_impact_ids]
+        events_with_random_impacts = self._events_with_ids(RANDOM_IMPACT_EVENT_IDS)
         
         if not events_with_random_impacts:
             self.skipTest("No events with random impact options found")
         
         for event in events_with_random_impacts:
-            try:
+            with self.subTest(event_id=event.get('id'), title=event.get('title')):
+                random.seed(event['id'])
                 processed_event = self.event_manager._process_event(event)
                 
                 # Find options with random impacts
@@ -215,13 +351,12 @@ class TestEvents(unittest.TestCase):
                                 # This is similar to what the UI would do
                                 selected_impact = random.choices(population=options, weights=weights, k=1)[0]
                                 self.assertIn(selected_impact, options)
-                                
-                print(f"Successfully tested event with random impacts: {event.get('id')} - {event.get('title')}")
-            except Exception as e:
-                self.fail(f"Event with random impacts {event.get('id')} - {event.get('title')} failed: {str(e)}")
     
     def test_difficulty_filter(self):
         """Test events are filtered by difficulty."""
+        # set_difficulty changes the config
+        self.event_manager.config = copy.deepcopy(_BASE_CONFIG)
+        
         # Mock the _process_event method to avoid issues with specific events
         with patch.object(self.event_manager, '_process_event', return_value={'id': 999, 'title': 'Test Event'}):
             # Test each difficulty level
@@ -236,10 +371,12 @@ class TestEvents(unittest.TestCase):
                 
                 # We're just testing that the method runs without error
                 # The actual events returned depend on random factors and difficulty weights
-                print(f"Successfully tested difficulty: {difficulty}")
     
     def test_season_stage_filter(self):
         """Test events are filtered by season stage."""
+        # The season stage is changed in the config below
+        self.event_manager.config = copy.deepcopy(_BASE_CONFIG)
+        
         # Using the proper season stage names with correct capitalization
         # These are the exact names used in the event_manager.py _get_allowed_stages method
         all_stages = [
@@ -261,7 +398,6 @@ class TestEvents(unittest.TestCase):
                 event = self.event_manager.roll_event()
                 
                 # We're just testing that the method runs without error
-                print(f"Successfully tested season stage: {stage}")
         
         # Also test the internal names used in the events.json file
         internal_stages = [
@@ -279,22 +415,19 @@ class TestEvents(unittest.TestCase):
                 event = self.event_manager.roll_event()
                 
                 # We're just testing that the method runs without error
-                print(f"Successfully tested internal season stage: {stage}")
     
     def test_trainer_events(self):
         """Test events with trainers work correctly."""
         # Choose specific event IDs with trainers
-        trainer_event_ids = [19, 20, 35, 69, 70, 71, 72, 73, 74, 75, 76]  # Events known to have trainers
-        
-        trainer_events = [e for e in self.events_data.get('events', []) 
-                         if e.get('id') in trainer_event_ids]
+        trainer_events = self._events_with_ids(TRAINER_EVENT_IDS)
         
         if not trainer_events:
             self.skipTest("No trainer events found")
         
         for event in trainer_events:
-            try:
+            with self.subTest(event_id=event.get('id'), title=event.get('title')):
                 # Process the event
+                random.seed(event['id'])
                 processed_event = self.event_manager._process_event(event)
                 
                 # Verify the trainer was selected and impact was applied
@@ -303,36 +436,22 @@ class TestEvents(unittest.TestCase):
                     self.assertNotIn('{trainer_impact}', processed_event.get('impact', ''))
                     if '{trainer}' in event.get('description', ''):
                         self.assertNotIn('{trainer}', processed_event.get('processed_description', ''))
-                
-                print(f"Successfully tested trainer event: {event.get('id')} - {event.get('title')}")
-            except Exception as e:
-                self.fail(f"Trainer event {event.get('id')} - {event.get('title')} failed: {str(e)}")
     
     def test_nested_options(self):
         """Test events with nested options (options within options)."""
         # Some events could have nested options in options[].options structure
-        nested_events = []
-        
-        # Manually check a few events that might have nested options
-        nested_event_ids = [12, 16, 68]  # Events that might have nested options
-        
-        events_to_check = [e for e in self.events_data.get('events', []) 
-                          if e.get('id') in nested_event_ids]
-        
-        # Find events with nested options
-        for event in events_to_check:
-            if 'options' in event:
-                for option in event['options']:
-                    if isinstance(option, dict) and 'options' in option:
-                        nested_events.append(event)
-                        break
-        
-        if not nested_events:
-            self.skipTest("No events with nested options found")
-        
-        for event in nested_events:
-            try:
+        found_nested = False
+        
+        # Manually check a few events that might have nested options, testing
+        # each one as soon as it turns out to have them
+        for event in self._events_with_ids(NESTED_EVENT_IDS):
+            if not any(isinstance(option, dict) and 'options' in option for option in event.get('options') or []):
+                continue
+            found_nested = True
+            
+            with self.subTest(event_id=event.get('id'), title=event.get('title')):
                 # Process the event
+                random.seed(event['id'])
                 processed_event = self.event_manager._process_event(event)
                 
                 # Verify first level options
@@ -349,49 +468,44 @@ class TestEvents(unittest.TestCase):
                         # Verify nested options have descriptions
                         for nested_option in nested_options:
                             self.assertIn('description', nested_option)
-                        
-                print(f"Successfully tested nested options event: {event.get('id')} - {event.get('title')}")
-            except Exception as e:
-                self.fail(f"Nested options event {event.get('id')} - {event.get('title')} failed: {str(e)}")
+        
+        if not found_nested:
+            self.skipTest("No events with nested options found")
     
+    @unittest.skipUnless(VERBOSE_TESTS, "informational listing; set VERBOSE_TESTS=1 to print it")
     def test_find_all_events_with_options(self):
         """Find all events that have options in the entire events.json file."""
         # This test helps identify which events have options for testing
-        events_with_options = []
-        
-        for event in self.events_data.get('events', []):
-            if 'options' in event and event['options']:
-                events_with_options.append((event.get('id'), event.get('title')))
+        events_with_options = load_events_with_options()
         
         print(f"Found {len(events_with_options)} events with options:")
-        for event_id, title in events_with_options:
-            print(f"Event ID: {event_id}, Title: {title}")
-        
-        # Not a real test, just informational
-        self.assertTrue(True)
+        for event in events_with_options:
+            print(f"Event ID: {event.get('id')}, Title: {event.get('title')}")
     
+    @unittest.skipUnless(VERBOSE_TESTS, "informational listing; set VERBOSE_TESTS=1 to print it")
     def test_find_all_events_with_random_impacts(self):
         """Find all events that have random impact options."""
         # This test helps identify which events have random impact options
-        events_with_random_impacts = []
-        
-        for event in self.events_data.get('events', []):
-            if 'options' in event:
-                for option in event['options']:
-                    if isinstance(option, dict) and 'impact_random_options' in option:
-                        events_with_random_impacts.append((event.get('id'), event.get('title')))
-                        break
+        events_with_random_impacts = load_events_with_random_impacts()
         
         print(f"Found {len(events_with_random_impacts)} events with random impacts:")
-        for event_id, title in events_with_random_impacts:
-            print(f"Event ID: {event_id}, Title: {title}")
-        
-        # Not a real test, just informational
-        self.assertTrue(True)
+        for event in events_with_random_impacts:
+            print(f"Event ID: {event.get('id')}, Title: {event.get('title')}")
     
     def test_event_schema_validation(self):
         """Test that all events in the JSON file follow the required schema."""
-        required_fields = ['id', 'title', 'description', 'difficulty_weights', 'category', 'season_stages']
+        if validate_event is not None:
+            # One compiled validator call per event; collect every failure before reporting
+            failures = []
+            for event in self.events_data.get('events', []):
+                try:
+                    validate_event(event)
+                except fastjsonschema.JsonSchemaException as e:
+                    failures.append(f"Event {event.get('id', 'unknown')} ({event.get('title', 'Unknown Event')}): {e.message}")
+            self.assertEqual(failures, [], "\n".join(failures))
+            return
+        
+        required_fields = EVENT_SCHEMA['required']
         
         for event in self.events_data.get('events', []):
             event_id = event.get('id', 'unknown')
@@ -402,8 +516,7 @@ class TestEvents(unittest.TestCase):
                 self.assertIn(field, event, f"Event {event_id} ({title}) is missing required field: {field}")
             
             # Check difficulty_weights has all levels
-            difficulty_levels = ["cupcake", "rookie", "pro", "all-madden", "diabolical"]
-            for level in difficulty_levels:
+            for level in DIFFICULTY_LEVELS:
                 self.assertIn(level, event['difficulty_weights'], 
                              f"Event {event_id} ({title}) is missing difficulty level: {level}")
             
@@ -423,8 +536,6 @@ class TestEvents(unittest.TestCase):
                     has_impact = 'impact' in option or 'impact_random_options' in option
                     self.assertTrue(has_impact, 
                                   f"Event {event_id} ({title}): Option {i} missing impact or impact_random_options")
-            
-            print(f"Event {event_id} ({title}) passed schema validation")
     
     def test_unrealistic_events(self):
         """Test that unrealistic events can be processed properly."""
@@ -441,20 +552,19 @@ class TestEvents(unittest.TestCase):
         
         total_events = len(unrealistic_events)
         processed_count = 0
-        failed_events = []
         
         # Set unrealistic events to be available
         self.event_manager.unrealistic_events = unrealistic_events
         
-        # Process each event
+        # Process each event as its own subtest
         for event in unrealistic_events:
             event_id = event.get('id', 'unknown')
             title = event.get('title', 'Unknown Event')
             
-            # Set random seed for deterministic testing
-            random.seed(event_id)
-            
-            try:
+            with self.subTest(event_id=event_id, title=title):
+                # Set random seed for deterministic testing
+                random.seed(event_id)
+                
                 # Process the event
                 processed_event = self.event_manager._process_event(event)
                 
@@ -466,61 +576,41 @@ class TestEvents(unittest.TestCase):
                 self.event_manager.accept_event(processed_event)
                 
                 processed_count += 1
-                print(f"Successfully processed unrealistic event {event_id}: {title}")
-            except Exception as e:
-                failed_events.append((event_id, title, str(e)))
-                print(f"Failed to process unrealistic event {event_id}: {title} - {str(e)}", file=sys.stderr)
-        
-        if failed_events:
-            for event_id, title, error in failed_events:
-                print(f"Unrealistic event {event_id} ({title}) failed: {error}", file=sys.stderr)
-            
-            self.fail(f"Failed to process {len(failed_events)} out of {total_events} unrealistic events.")
         
         if processed_count > 0:
-            print(f"Successfully processed all {processed_count} unrealistic events.")
+            print(f"Successfully processed {processed_count} out of {total_events} unrealistic events.")
         else:
             self.skipTest("No unrealistic events were processed.")
             
     def test_combined_event_pool(self):
         """Test that both regular and unrealistic events can be part of the event pool."""
+        self.event_manager.config = copy.deepcopy(_BASE_CONFIG)
+        regular_events = self.events_data.get('events', [])
+        unrealistic_events = self.unrealistic_events_data.get('unrealistic_events', [])
+        
         # Ensure unrealistic events are enabled
         self.event_manager.config['unrealistic_events_enabled'] = True
         
-        # Get the combined event pool - using the public method in EventManager
-        # Instead of _get_event_pool() which doesn't exist, we'll use roll_event() which internally builds the pool
-        # Set a seed for deterministic results
+        # The pool holds the regular events followed by the unrealistic ones. Ids
+        # repeat across the two files, so compare the event objects themselves
+        event_pool = self.event_manager.get_event_pool()
+        expected_pool = regular_events + unrealistic_events
+        self.assertEqual(len(event_pool), len(expected_pool))
+        self.assertTrue(all(pooled is expected for pooled, expected in zip(event_pool, expected_pool)),
+                        "Event pool should contain the regular events followed by the unrealistic events")
+        
+        print(f"Available regular events: {len(regular_events)}")
+        print(f"Available unrealistic events: {len(unrealistic_events)}")
+        
+        # A roll picks from that pool; set a seed for deterministic results
         random.seed(42)
+        event = self.event_manager.roll_event()
+        self.assertIsNotNone(event, "Should be able to roll an event")
+        self.assertIn(event.get('id'), {e.get('id') for e in event_pool})
         
-        # Try to roll an event a few times to test the event pool functionality
-        events_rolled = []
-        for _ in range(10):
-            event = self.event_manager.roll_event()
-            if event:
-                events_rolled.append(event)
-        
-        # Verify that we got at least some events
-        self.assertTrue(len(events_rolled) > 0, "Should be able to roll at least some events")
-        
-        # If there are unrealistic events, check if any were rolled
-        if self.unrealistic_events_data.get('unrealistic_events', []):
-            # Check if the unrealistic events were included in the rolled events
-            unrealistic_ids = [e.get('id') for e in self.unrealistic_events_data.get('unrealistic_events', [])]
-            rolled_ids = [e.get('id') for e in events_rolled]
-            
-            print(f"Rolled {len(events_rolled)} events")
-            print(f"Available regular events: {len(self.events_data.get('events', []))}")
-            print(f"Available unrealistic events: {len(self.unrealistic_events_data.get('unrealistic_events', []))}")
-            
-            # Note that there's a chance no unrealistic events were rolled due to randomness
-            # So this is just informational rather than an assertion
-            unrealistic_rolled = any(id in unrealistic_ids for id in rolled_ids)
-            if unrealistic_rolled:
-                print("At least one unrealistic event was included in the rolled events")
-            else:
-                print("No unrealistic events were rolled in this test run (this can happen due to randomness)")
-        else:
-            print("No unrealistic events found to test combined pool.")
+        # With unrealistic events disabled only the regular events remain
+        self.event_manager.config['unrealistic_events_enabled'] = False
+        self.assertEqual(len(self.event_manager.get_event_pool()), len(regular_events))
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
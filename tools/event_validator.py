@@ -9,9 +9,15 @@ Run with --fix to apply automatic fixes, or --validate to just report issues.
 import json
 import os
 import argparse
+import shutil
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 
@@ -22,8 +28,404 @@ UNREALISTIC_EVENTS_PATH = PROJECT_ROOT / "madden_franchise_qt" / "data" / "unrea
 # Required fields for all events
 REQUIRED_EVENT_FIELDS = ['id', 'title', 'description', 'difficulty_weights', 'category', 'season_stages']
 DIFFICULTY_LEVELS = ["cupcake", "rookie", "pro", "all-madden", "diabolical"]
+_REQUIRED_FIELD_SET = frozenset(REQUIRED_EVENT_FIELDS)
+_DIFFICULTY_LEVEL_SET = frozenset(DIFFICULTY_LEVELS)
+
+# Defaults used by --fix, copied into each event that needs them
+DEFAULT_DIFFICULTY_WEIGHT = 0.2
+_DEFAULT_DIFFICULTY_WEIGHTS = {level: DEFAULT_DIFFICULTY_WEIGHT for level in DIFFICULTY_LEVELS}
+_DEFAULT_SEASON_STAGES = ('pre-season', 'regular-season-mid')
+# Required fields --fix can fill in with the defaults above
+_FIXABLE_FIELDS = frozenset(('difficulty_weights', 'category', 'season_stages'))
+
+# JSON Schema that only accepts events the checks below have nothing to report
+# on. Stricter types are fine, since a rejected event is simply checked by hand
+EVENT_SCHEMA = {
+    "type": "object",
+    "required": REQUIRED_EVENT_FIELDS,
+    "properties": {
+        "difficulty_weights": {"type": "object", "required": DIFFICULTY_LEVELS},
+        "result_options": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["probability"],
+                "dependencies": {"impact_text": ["result"]}
+            }
+        },
+        # Options that are not objects are not checked
+        "options": {
+            "type": "array",
+            "items": {
+                "required": ["description"],
+                "anyOf": [{"required": ["impact"]}, {"required": ["impact_random_options"]}]
+            }
+        }
+    }
+}
+
+# Engines that can check EVENT_SCHEMA; 'python' means every event goes through the
+# hand-written checks, and 'auto' picks the fastest one installed
+SCHEMA_ENGINES = ('auto', 'rust', 'fastjsonschema', 'python')
+
+def _compile_schema(engine):
+    """
+    Compile EVENT_SCHEMA with the given engine.
+    
+    The engine's package is only imported here, so runs that never pick an
+    engine don't pay for importing it.
+    
+    Args:
+        engine (str): One of SCHEMA_ENGINES
+        
+    Returns:
+        callable: Returns True for events the schema accepts, or None when no schema is used
+        
+    Raises:
+        ImportError: If the package for an explicitly chosen engine is not installed
+    """
+    if engine == 'auto':
+        for candidate in ('rust', 'fastjsonschema'):
+            try:
+                return _compile_schema(candidate)
+            except ImportError:
+                pass
+        return None
+    
+    if engine == 'rust':
+        import jsonschema_rs
+        return jsonschema_rs.Draft7Validator(EVENT_SCHEMA).is_valid
+    if engine == 'fastjsonschema':
+        import fastjsonschema
+        validate = fastjsonschema.compile(EVENT_SCHEMA)
+        
+        def is_valid(event):
+            try:
+                validate(event)
+            except fastjsonschema.JsonSchemaException:
+                return False
+            return True
+        
+        return is_valid
+    return None
+
+def _use_schema_engine(engine):
+    """Switch the schema check used for every event; also initializes pool workers."""
+    global _schema_engine, _schema_is_valid
+    _schema_engine = engine
+    _schema_is_valid = _compile_schema(engine)
+
+# No schema until main() compiles the engine picked with --engine
+_schema_engine = 'python'
+_schema_is_valid = None
+
+# Records the files behind the last clean --validate run, so repeating it on unchanged
+# files can stop straight away
+VALIDATOR_STAMP_FILE = '.event_validator.stamp'
+
+# Validation-only runs over more events than this are split across worker processes
+PARALLEL_THRESHOLD = 1000
+PARALLEL_CHUNK_SIZE = 512
+
+def _read_bytes(path):
+    """Read a whole file as bytes with os.read, bypassing Python's buffered file objects."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        raw = os.read(fd, size)
+        # A single read can come back short for very large files
+        while len(raw) < size:
+            chunk = os.read(fd, size - len(raw))
+            if not chunk:
+                break
+            raw += chunk
+    finally:
+        os.close(fd)
+    return raw
+
+def _load_json_file(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    raw = _read_bytes(path)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _encode_json(value):
+    """
+    Encode a value as JSON bytes indented by 2 spaces.
+    
+    The json module's default ASCII escaping is kept on purpose: the app opens
+    events.json in the platform's default encoding, so raw UTF-8 (as orjson
+    writes it) would be misread on Windows.
+    """
+    return json.dumps(value, indent=2).encode('ascii')
+
+def _dump_json_file(path, data):
+    """
+    Write data to a JSON file indented by 2 spaces, one list item at a time.
+    
+    Each event is encoded and written on its own, so the whole file never has to
+    be held in memory as a single string. The result matches encoding the data
+    in one go.
+    
+    The data goes to a temporary file next to path, which then replaces path, so a
+    failed write never leaves a half-written events file behind.
+    """
+    tmp_path = str(path) + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(b'{')
+            for key_index, (key, value) in enumerate(data.items()):
+                f.write(b',\n  ' if key_index else b'\n  ')
+                f.write(_encode_json(key) + b': ')
+                if isinstance(value, list) and value:
+                    f.write(b'[')
+                    for item_index, item in enumerate(value):
+                        f.write(b',\n    ' if item_index else b'\n    ')
+                        # JSON strings cannot hold raw newlines, so every newline is indentation
+                        f.write(_encode_json(item).replace(b'\n', b'\n    '))
+                    f.write(b'\n  ]')
+                else:
+                    f.write(_encode_json(value).replace(b'\n', b'\n  '))
+            f.write(b'\n}' if data else b'}')
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _passes_schema(event):
+    """Return True if the compiled EVENT_SCHEMA accepts the event, meaning it has no issues."""
+    return _schema_is_valid is not None and _schema_is_valid(event)
+
+def _stamp_key(include_unrealistic):
+    """Identify the files a validation run reads by their modification time and size."""
+    paths = [Path(__file__), EVENTS_PATH]
+    if include_unrealistic:
+        paths.append(UNREALISTIC_EVENTS_PATH)
+    key = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            key.append(None)
+            continue
+        key.append([stat.st_mtime_ns, stat.st_size])
+    return json.dumps(key)
+
+def _read_stamp(stamp_path):
+    """Return the key stored by the last clean validation, or None if there is none."""
+    try:
+        with open(stamp_path, 'r') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _write_stamp(stamp_path, key):
+    """Store the key of a clean validation; a stamp that cannot be written is skipped."""
+    try:
+        with open(stamp_path, 'w') as f:
+            f.write(key)
+    except OSError:
+        pass
+
+def _find_issues(event):
+    """
+    Find every problem in an event without changing it.
+    
+    This is the only place the checks live; _validate reports its result and
+    _validate_and_fix also repairs what it can from it.
+    
+    Args:
+        event (dict): The event to check
+        
+    Returns:
+        list: (message, kind, detail) for each issue, in report order. kind names the
+            automatic fix ('field', 'level', 'result', 'probability' or 'impact'), or
+            is None when there is none. detail is the missing field or level name, or
+            the (number, option) pair for issues in an option
+    """
+    issues = []
+    
+    event_id = event.get('id', 'unknown')
+    title = event.get('title', 'Unknown Event')
+    # Every error message starts with the same event description
+    prefix = f"Event {event_id} ({title})"
+    
+    # Check for required fields. Most events have them all, so one set difference
+    # finds the missing ones, which are then reported in REQUIRED_EVENT_FIELDS order
+    missing_fields = _REQUIRED_FIELD_SET - event.keys()
+    if missing_fields:
+        for field in REQUIRED_EVENT_FIELDS:
+            if field in missing_fields:
+                kind = 'field' if field in _FIXABLE_FIELDS else None
+                issues.append((f"ERROR: {prefix} is missing required field: {field}", kind, field))
+    
+    # Check difficulty weights the same way, reported in DIFFICULTY_LEVELS order
+    if 'difficulty_weights' in event:
+        missing_levels = _DIFFICULTY_LEVEL_SET.difference(event['difficulty_weights'])
+        if missing_levels:
+            for level in DIFFICULTY_LEVELS:
+                if level in missing_levels:
+                    issues.append((f"ERROR: {prefix} is missing difficulty level: {level}", 'level', level))
+    
+    # Check result_options
+    if 'result_options' in event:
+        for number, option in enumerate(event['result_options'], 1):
+            if 'impact_text' in option and 'result' not in option:
+                issues.append((f"ERROR: {prefix} has result_option {number} without a 'result' field",
+                               'result', (number, option)))
+            
+            if 'probability' not in option:
+                issues.append((f"ERROR: {prefix} has result_option {number} without a 'probability' field",
+                               'probability', (number, option)))
+    
+    # Check options
+    if 'options' in event:
+        for number, option in enumerate(event['options'], 1):
+            if type(option) is dict:
+                if 'description' not in option:
+                    issues.append((f"ERROR: {prefix} has option {number} without a 'description' field",
+                                   None, (number, option)))
+                
+                if 'impact' not in option and 'impact_random_options' not in option:
+                    issues.append((f"ERROR: {prefix} has option {number} without 'impact' or 'impact_random_options'",
+                                   'impact', (number, option)))
+    
+    return issues
+
+def _validate(event, out):
+    """
+    Validate a single event without changing it.
+    
+    Messages are appended to out instead of printed, so a whole file's worth
+    of them can be written to stdout at once.
+    
+    Args:
+        event (dict): The event to check
+        out (list): Collects the error messages for the event
+        
+    Returns:
+        tuple: (num_issues, 0)
+    """
+    # Most events are valid, and the compiled schema confirms that much faster
+    if _passes_schema(event):
+        return 0, 0
+    
+    issues = _find_issues(event)
+    out.extend(message for message, _, _ in issues)
+    return len(issues), 0
 
-def validate_events(events_data, events_type="standard", fix=False):
+def _validate_and_fix(event, out):
+    """
+    Validate a single event and fix its issues in place.
+    
+    Args:
+        event (dict): The event to check
+        out (list): Collects the error and fix messages for the event
+        
+    Returns:
+        tuple: (num_issues, num_fixed)
+    """
+    # Most events are valid, and the compiled schema confirms that much faster
+    if _passes_schema(event):
+        return 0, 0
+    
+    issues = _find_issues(event)
+    fixed_count = 0
+    event_id = event.get('id', 'unknown')
+    # Probability totals for splitting the remainder, updated as options are fixed
+    total_prob = remaining_options = None
+    
+    for message, kind, detail in issues:
+        out.append(message)
+        
+        if kind == 'field':
+            # Add default values for fixable fields
+            if detail == 'difficulty_weights':
+                event[detail] = dict(_DEFAULT_DIFFICULTY_WEIGHTS)
+                out.append(f"  FIXED: Added default difficulty_weights to event {event_id}")
+            elif detail == 'category':
+                event[detail] = 'misc'
+                out.append(f"  FIXED: Added default category 'misc' to event {event_id}")
+            else:
+                event[detail] = list(_DEFAULT_SEASON_STAGES)
+                out.append(f"  FIXED: Added default season_stages to event {event_id}")
+            fixed_count += 1
+        
+        elif kind == 'level':
+            event['difficulty_weights'][detail] = DEFAULT_DIFFICULTY_WEIGHT
+            out.append(f"  FIXED: Added default weight for {detail} to event {event_id}")
+            fixed_count += 1
+        
+        elif kind == 'result':
+            number, option = detail
+            # Create a result identifier based on index
+            impact_text = option['impact_text'].lower()
+            if 'success' in impact_text:
+                result_name = 'success'
+            elif 'failure' in impact_text or 'backfire' in impact_text:
+                result_name = 'failure'
+            else:
+                result_name = f"result_{number}"
+            
+            option['result'] = result_name
+            out.append(f"  FIXED: Added 'result' field to option {number} in event {event_id}")
+            fixed_count += 1
+        
+        elif kind == 'probability':
+            number, option = detail
+            if total_prob is None:
+                result_options = event['result_options']
+                total_prob = sum(opt.get('probability', 0) for opt in result_options)
+                remaining_options = ['probability' not in opt for opt in result_options].count(True)
+            
+            # Divide remaining probability evenly
+            share = round((1.0 - total_prob) / remaining_options, 2)
+            option['probability'] = share
+            total_prob += share
+            remaining_options -= 1
+            out.append(f"  FIXED: Added probability {share} to option {number} in event {event_id}")
+            fixed_count += 1
+        
+        elif kind == 'impact':
+            number, option = detail
+            option['impact'] = "No specific impact. Implement game changes as appropriate."
+            out.append(f"  FIXED: Added default impact to option {number} in event {event_id}")
+            fixed_count += 1
+    
+    return len(issues), fixed_count
+
+def _validate_chunk(events):
+    """
+    Validate a list of events without changing them, in a worker process.
+    
+    Args:
+        events (list): The events to check
+        
+    Returns:
+        tuple: (num_issues, messages)
+    """
+    out = []
+    issues_count = 0
+    for event in events:
+        issues_count += _validate(event, out)[0]
+    return issues_count, out
+
+def _write_messages(out):
+    """Write the collected messages to stdout in a single call."""
+    if out:
+        out.append('')
+        sys.stdout.write('\n'.join(out))
+
+def _print_summary(events_type, issues_count, fixed_count, fix):
+    """Print the issue totals for one events file."""
+    print(f"\nValidation Summary for {events_type} events:")
+    print(f"  {issues_count} issues found")
+    if fix:
+        print(f"  {fixed_count} issues fixed")
+
+def validate_events(events_data, events_type="standard", fix=False, quiet=False):
     """
     Validate the events in the provided data and optionally fix issues.
     
@@ -31,6 +433,7 @@ def validate_events(events_data, events_type="standard", fix=False):
         events_data (dict): The events data loaded from JSON
         events_type (str): The type of events being validated ('standard' or 'unrealistic')
         fix (bool): Whether to fix issues or just report them
+        quiet (bool): Whether to leave out the per-issue messages and only print the summary
         
     Returns:
         tuple: (fixed_data, num_issues, num_fixed)
@@ -43,146 +446,147 @@ def validate_events(events_data, events_type="standard", fix=False):
     issues_count = 0
     fixed_count = 0
     
+    out = []
+    
     print(f"\nValidating {len(events)} {events_type} events...")
     
-    # Process each event
-    for event in events:
-        event_id = event.get('id', 'unknown')
-        title = event.get('title', 'Unknown Event')
+    if not fix and len(events) > PARALLEL_THRESHOLD:
+        # Events are independent, so large read-only runs are checked in chunks across
+        # processes. map() returns the results in order, keeping the messages in order too
+        from concurrent.futures import ProcessPoolExecutor
         
-        # Check for required fields
-        for field in REQUIRED_EVENT_FIELDS:
-            if field not in event:
-                issues_count += 1
-                print(f"ERROR: Event {event_id} ({title}) is missing required field: {field}")
-                
-                # Add default values for fixable fields
-                if fix:
-                    if field == 'difficulty_weights':
-                        event[field] = {level: 0.2 for level in DIFFICULTY_LEVELS}
-                        print(f"  FIXED: Added default difficulty_weights to event {event_id}")
-                        fixed_count += 1
-                    elif field == 'category':
-                        event[field] = 'misc'
-                        print(f"  FIXED: Added default category 'misc' to event {event_id}")
-                        fixed_count += 1
-                    elif field == 'season_stages':
-                        event[field] = ['pre-season', 'regular-season-mid']
-                        print(f"  FIXED: Added default season_stages to event {event_id}")
-                        fixed_count += 1
-        
-        # Check difficulty weights
-        if 'difficulty_weights' in event:
-            for level in DIFFICULTY_LEVELS:
-                if level not in event['difficulty_weights']:
-                    issues_count += 1
-                    print(f"ERROR: Event {event_id} ({title}) is missing difficulty level: {level}")
-                    
-                    if fix:
-                        event['difficulty_weights'][level] = 0.2
-                        print(f"  FIXED: Added default weight for {level} to event {event_id}")
-                        fixed_count += 1
-        
-        # Check result_options
-        if 'result_options' in event:
-            for i, option in enumerate(event['result_options']):
-                # Check for result field
-                if 'impact_text' in option and 'result' not in option:
-                    issues_count += 1
-                    print(f"ERROR: Event {event_id} ({title}) has result_option {i+1} without a 'result' field")
-                    
-                    if fix:
-                        # Create a result identifier based on index
-                        if 'success' in option.get('impact_text', '').lower():
-                            result_name = 'success'
-                        elif 'failure' in option.get('impact_text', '').lower() or 'backfire' in option.get('impact_text', '').lower():
-                            result_name = 'failure'
-                        else:
-                            result_name = f"result_{i+1}"
-                        
-                        option['result'] = result_name
-                        print(f"  FIXED: Added 'result' field to option {i+1} in event {event_id}")
-                        fixed_count += 1
-                
-                # Check for probability field
-                if 'probability' not in option:
-                    issues_count += 1
-                    print(f"ERROR: Event {event_id} ({title}) has result_option {i+1} without a 'probability' field")
-                    
-                    if fix:
-                        # Divide remaining probability evenly
-                        total_prob = sum(opt.get('probability', 0) for opt in event['result_options'])
-                        remaining = 1.0 - total_prob
-                        remaining_options = sum(1 for opt in event['result_options'] if 'probability' not in opt)
-                        if remaining_options > 0:
-                            option['probability'] = round(remaining / remaining_options, 2)
-                            print(f"  FIXED: Added probability {option['probability']} to option {i+1} in event {event_id}")
-                            fixed_count += 1
-        
-        # Check options
-        if 'options' in event:
-            for i, option in enumerate(event['options']):
-                if isinstance(option, dict):
-                    if 'description' not in option:
-                        issues_count += 1
-                        print(f"ERROR: Event {event_id} ({title}) has option {i+1} without a 'description' field")
-                    
-                    has_impact = 'impact' in option or 'impact_random_options' in option
-                    if not has_impact:
-                        issues_count += 1
-                        print(f"ERROR: Event {event_id} ({title}) has option {i+1} without 'impact' or 'impact_random_options'")
-                        
-                        if fix:
-                            option['impact'] = "No specific impact. Implement game changes as appropriate."
-                            print(f"  FIXED: Added default impact to option {i+1} in event {event_id}")
-                            fixed_count += 1
+        chunks = [events[i:i + PARALLEL_CHUNK_SIZE] for i in range(0, len(events), PARALLEL_CHUNK_SIZE)]
+        with ProcessPoolExecutor(initializer=_use_schema_engine, initargs=(_schema_engine,)) as executor:
+            for chunk_issues, chunk_out in executor.map(_validate_chunk, chunks):
+                issues_count += chunk_issues
+                out.extend(chunk_out)
+    else:
+        # Pick the checker once; the read-only one skips all of the fix branches
+        worker = _validate_and_fix if fix else _validate
+        
+        # Process each event
+        for event in events:
+            event_issues, event_fixed = worker(event, out)
+            issues_count += event_issues
+            fixed_count += event_fixed
     
-    print(f"\nValidation Summary for {events_type} events:")
-    print(f"  {issues_count} issues found")
-    if fix:
-        print(f"  {fixed_count} issues fixed")
+    if not quiet:
+        _write_messages(out)
+    _print_summary(events_type, issues_count, fixed_count, fix)
     
     return events_data, issues_count, fixed_count
 
+def validate_events_stream(path, events_type="standard", quiet=False):
+    """
+    Validate events read one at a time from a file, without fixing them.
+    
+    Only one event is held in memory at a time, so this needs ijson and is
+    used for --validate runs, which never rewrite the file.
+    
+    Args:
+        path: Path to the events JSON file
+        events_type (str): The type of events being validated ('standard' or 'unrealistic')
+        quiet (bool): Whether to leave out the per-issue messages and only print the summary
+        
+    Returns:
+        int: Number of issues found
+    """
+    import ijson
+    
+    prefix = 'events.item' if events_type == "standard" else 'unrealistic_events.item'
+    issues_count = 0
+    events_count = 0
+    out = []
+    
+    print(f"\nValidating {events_type} events...")
+    
+    with open(path, 'rb') as f:
+        for event in ijson.items(f, prefix):
+            events_count += 1
+            issues_count += _validate(event, out)[0]
+    
+    if not quiet:
+        _write_messages(out)
+    print(f"Checked {events_count} {events_type} events")
+    _print_summary(events_type, issues_count, 0, False)
+    
+    return issues_count
+
 def main():
     parser = argparse.ArgumentParser(description="Validate and fix event files")
     parser.add_argument('--validate', action='store_true', help='Validate events without fixing')
     parser.add_argument('--fix', action='store_true', help='Fix issues in events files')
     parser.add_argument('--unrealistic', action='store_true', help='Also process unrealistic events')
+    parser.add_argument('--quiet', action='store_true', help='Only print the summary for each events file')
+    parser.add_argument('--no-cache', action='store_true', help='Check every event and leave the stamp file alone')
+    parser.add_argument('--engine', choices=SCHEMA_ENGINES, default='auto',
+                        help='Schema engine that passes valid events quickly: rust (jsonschema-rs), fastjsonschema, '
+                             'python (hand-written checks only) or auto for the fastest installed (default: %(default)s)')
     args = parser.parse_args()
     
     if not (args.validate or args.fix):
         parser.print_help()
         sys.exit(1)
     
+    try:
+        _use_schema_engine(args.engine)
+    except ImportError:
+        package = 'jsonschema-rs' if args.engine == 'rust' else 'fastjsonschema'
+        parser.error(f"--engine {args.engine} needs the {package} package")
+    
+    # Repeating a clean validation on unchanged files has nothing new to report
+    stamp_path = PROJECT_ROOT / VALIDATOR_STAMP_FILE
+    stamp_key = None
+    if not args.fix and not args.no_cache:
+        stamp_key = _stamp_key(args.unrealistic)
+        if _read_stamp(stamp_path) == stamp_key:
+            print("Events files are unchanged since the last clean validation.")
+            sys.exit(0)
+    
+    # Validation alone never rewrites the files, so stream the events when ijson is available
+    stream = False
+    json_errors = (json.JSONDecodeError,)
+    if not args.fix:
+        try:
+            import ijson
+        except ImportError:
+            pass
+        else:
+            stream = True
+            json_errors += (ijson.JSONError,)
+    total_issues = 0
+    
     # Process standard events
     print(f"Processing events file: {EVENTS_PATH}")
     try:
-        with open(EVENTS_PATH, 'r') as f:
-            events_data = json.load(f)
+        if stream:
+            issues = validate_events_stream(EVENTS_PATH, "standard", args.quiet)
+            fixed = 0
+        else:
+            events_data = _load_json_file(EVENTS_PATH)
     except FileNotFoundError:
         print(f"ERROR: Events file not found at {EVENTS_PATH}")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except json_errors:
         print(f"ERROR: Invalid JSON in events file at {EVENTS_PATH}")
         sys.exit(1)
     
-    fixed_data, issues, fixed = validate_events(events_data, "standard", args.fix)
+    if not stream:
+        fixed_data, issues, fixed = validate_events(events_data, "standard", args.fix, args.quiet)
+    total_issues += issues
     
     if args.fix and fixed > 0:
-        # Backup original file
+        # Backup original file by copying its bytes, since events_data already holds the fixes
         backup_path = str(EVENTS_PATH) + '.backup'
         try:
-            with open(backup_path, 'w') as f:
-                json.dump(events_data, f, indent=2)
+            shutil.copyfile(EVENTS_PATH, backup_path)
             print(f"Backed up original file to {backup_path}")
         except Exception as e:
             print(f"WARNING: Failed to backup original file: {str(e)}")
         
         # Save fixed file
         try:
-            with open(EVENTS_PATH, 'w') as f:
-                json.dump(fixed_data, f, indent=2)
+            _dump_json_file(EVENTS_PATH, fixed_data)
             print(f"Saved fixed events to {EVENTS_PATH}")
         except Exception as e:
             print(f"ERROR: Failed to save fixed events: {str(e)}")
@@ -196,33 +600,39 @@ def main():
         else:
             print(f"\nProcessing unrealistic events file: {UNREALISTIC_EVENTS_PATH}")
             try:
-                with open(UNREALISTIC_EVENTS_PATH, 'r') as f:
-                    unrealistic_data = json.load(f)
-            except json.JSONDecodeError:
+                if stream:
+                    issues = validate_events_stream(UNREALISTIC_EVENTS_PATH, "unrealistic", args.quiet)
+                    fixed = 0
+                else:
+                    unrealistic_data = _load_json_file(UNREALISTIC_EVENTS_PATH)
+            except json_errors:
                 print(f"ERROR: Invalid JSON in unrealistic events file at {UNREALISTIC_EVENTS_PATH}")
                 sys.exit(1)
             
-            fixed_data, issues, fixed = validate_events(unrealistic_data, "unrealistic", args.fix)
+            if not stream:
+                fixed_data, issues, fixed = validate_events(unrealistic_data, "unrealistic", args.fix, args.quiet)
+            total_issues += issues
             
             if args.fix and fixed > 0:
-                # Backup original file
+                # Backup original file by copying its bytes, since unrealistic_data already holds the fixes
                 backup_path = str(UNREALISTIC_EVENTS_PATH) + '.backup'
                 try:
-                    with open(backup_path, 'w') as f:
-                        json.dump(unrealistic_data, f, indent=2)
+                    shutil.copyfile(UNREALISTIC_EVENTS_PATH, backup_path)
                     print(f"Backed up original unrealistic events to {backup_path}")
                 except Exception as e:
                     print(f"WARNING: Failed to backup original unrealistic events file: {str(e)}")
                 
                 # Save fixed file
                 try:
-                    with open(UNREALISTIC_EVENTS_PATH, 'w') as f:
-                        json.dump(fixed_data, f, indent=2)
+                    _dump_json_file(UNREALISTIC_EVENTS_PATH, fixed_data)
                     print(f"Saved fixed unrealistic events to {UNREALISTIC_EVENTS_PATH}")
                 except Exception as e:
                     print(f"ERROR: Failed to save fixed unrealistic events: {str(e)}")
                     sys.exit(1)
     
+    if stamp_key is not None and total_issues == 0:
+        _write_stamp(stamp_path, stamp_key)
+    
     print("\nDone!")
 
 if __name__ == "__main__":